@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Asyncio/Playwright variant of the bandwidth scraper.
+
+The Selenium-based ``bandwidth_scraper.py`` remains the default entrypoint; this
+module reuses its in-browser extraction scripts and output format so both write
+identical ``device_bandwidth_*.json`` snapshots.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from bandwidth_scraper import (
+    EXPAND_ROWS_JS,
+    EXPANDED_COUNT_JS,
+    LAN_EXTRACT_JS,
+    LAN_ROWS_SELECTOR,
+    WAN_EXTRACT_JS,
+    build_lan_devices,
+    build_wan_metrics,
+    parse_lan_from_html,
+    parse_wan_from_html,
+    write_bandwidth_output,
+)
+from router_scraper import configure_logging, load_config
+
+LOGGER = logging.getLogger("async_bandwidth_scraper")
+
+_TAB_ACTIVE_JS = """
+(label) => Array.from(document.querySelectorAll('div.cat-info')).some(
+  (el) => el.textContent.trim() === label && el.classList.contains('cat_highlight')
+)
+"""
+_ROWS_EXPANDED_JS = "(count) => (() => {" + EXPANDED_COUNT_JS + "})() >= count"
+
+
+def _as_function(script: str) -> str:
+    """Wrap a WebDriver-style script body (which uses ``return``) for ``page.evaluate``."""
+
+    return "() => {" + script + "}"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scrape WAN/LAN bandwidth statistics with Playwright.")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path(__file__).with_name("config.ini"),
+        help="Path to configuration .ini file.",
+    )
+    parser.add_argument(
+        "--password",
+        help="Override password defined in the config.ini file.",
+    )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Force headless mode on/off (overrides config).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Override the output directory.",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable verbose debug logging.",
+    )
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=1.0,
+        help="Maximum seconds to wait for each bandwidth tab's table to render after switching to it.",
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=int,
+        default=10,
+        help="Seconds to wait for page elements before giving up.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Keep the browser open and collect every N seconds instead of running once.",
+    )
+    return parser.parse_args()
+
+
+class AsyncBandwidthScraper:
+    def __init__(self, base_url: str, password: str, page: Page, timeout: int = 10, delay: float = 1.0) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.password = password
+        self.page = page
+        self.timeout_ms = timeout * 1000
+        self.delay_ms = delay * 1000
+
+    async def login(self) -> None:
+        login_url = f"{self.base_url}/#/login/"
+        LOGGER.info("Navigating to login page %s", login_url)
+        await self.page.goto(login_url)
+        try:
+            # The first navigation also pulls the SPA bundles, so allow it more time.
+            password_field = await self.page.wait_for_selector('input[type="password"]', timeout=20_000)
+        except PlaywrightTimeoutError as err:
+            LOGGER.error("Password field did not load: %s", err)
+            raise
+
+        await password_field.fill(self.password)
+        LOGGER.debug("Password entered, attempting to submit login form.")
+        await self.page.click('button[aria-label="Log In"]', timeout=self.timeout_ms)
+
+        try:
+            await self.page.wait_for_selector("#navigation_bar", timeout=self.timeout_ms)
+            LOGGER.info("Login successful.")
+        except PlaywrightTimeoutError:
+            LOGGER.warning("Navigation bar did not appear; continuing assuming existing session.")
+
+    async def ensure_session(self) -> None:
+        if await self.page.query_selector("#navigation_bar") is None:
+            LOGGER.info("Router session appears to have expired; logging in again.")
+            await self.login()
+
+    async def collect_bandwidth_usage(self, run_id: str, collected_at: str) -> Dict[str, object]:
+        bandwidth_url = f"{self.base_url}/#/adv/monitoring/bandwidth"
+        LOGGER.info("Collecting bandwidth metrics from %s", bandwidth_url)
+        try:
+            await self.page.goto(bandwidth_url)
+            await self.page.wait_for_selector("div.cat-info", timeout=self.timeout_ms)
+        except PlaywrightTimeoutError as err:
+            LOGGER.warning("Bandwidth page did not load: %s", err)
+            return {}
+
+        wan_metrics = await self._scrape_wan_bandwidth()
+        lan_devices = await self._scrape_lan_bandwidth()
+
+        if not wan_metrics and not lan_devices:
+            return {}
+
+        return {
+            "run_id": run_id,
+            "collected_at": collected_at,
+            "wan": wan_metrics,
+            "lan_devices": lan_devices,
+        }
+
+    async def _scrape_wan_bandwidth(self) -> Dict[str, int]:
+        if not await self._select_bandwidth_tab("WAN"):
+            return {}
+
+        try:
+            # The WAN table renders after the tab switch; poll until it is there rather than racing it.
+            handle = await self.page.wait_for_function(
+                _as_function(WAN_EXTRACT_JS), polling=100, timeout=self.delay_ms
+            )
+            metrics = await handle.json_value()
+        except PlaywrightTimeoutError:
+            LOGGER.debug("WAN usage table did not render after %.1fs.", self.delay_ms / 1000)
+            metrics = None
+        if not metrics:
+            metrics = await asyncio.to_thread(parse_wan_from_html, await self.page.content())
+        return build_wan_metrics(metrics)
+
+    async def _scrape_lan_bandwidth(self) -> List[Dict[str, object]]:
+        if not await self._select_bandwidth_tab("LAN"):
+            return []
+
+        # The device rows render after the tab switch, not with the page.
+        await self._wait_for_content(LAN_ROWS_SELECTOR)
+        device_count = await self.page.evaluate(_as_function(EXPAND_ROWS_JS))
+        if not device_count:
+            LOGGER.warning("No device entries found on the LAN bandwidth tab.")
+            return []
+        try:
+            await self.page.wait_for_function(_ROWS_EXPANDED_JS, arg=device_count, polling=100, timeout=5_000)
+        except PlaywrightTimeoutError:
+            LOGGER.debug("Not every LAN row expanded; parsing the rows that did.")
+
+        rows = await self.page.evaluate(_as_function(LAN_EXTRACT_JS))
+        if not rows:
+            return await asyncio.to_thread(parse_lan_from_html, await self.page.content())
+        return build_lan_devices(rows)
+
+    async def _wait_for_content(self, selector: str) -> None:
+        """Wait up to ``delay`` seconds for ``selector`` to render, returning early once it does."""
+
+        try:
+            await self.page.wait_for_selector(selector, timeout=self.delay_ms)
+        except PlaywrightTimeoutError:
+            LOGGER.debug("Nothing matched %s after %.1fs; scraping anyway.", selector, self.delay_ms / 1000)
+
+    async def _select_bandwidth_tab(self, label: str) -> bool:
+        exact_label = re.compile(rf"^\s*{re.escape(label)}\s*$")
+        tab = self.page.locator("div.cat-info").filter(has_text=exact_label).first
+        if not await tab.count():
+            LOGGER.warning("Unable to find %s tab on the bandwidth page.", label)
+            return False
+
+        classes = await tab.get_attribute("class") or ""
+        if "cat_highlight" not in classes:
+            await tab.click()
+        try:
+            await self.page.wait_for_function(_TAB_ACTIVE_JS, arg=label, polling=100, timeout=self.timeout_ms)
+        except PlaywrightTimeoutError:
+            LOGGER.warning("Timed out waiting for %s tab to activate.", label)
+            return False
+        return True
+
+
+async def collect_once(scraper: AsyncBandwidthScraper, output_dir: Path) -> bool:
+    await scraper.login()
+    now = datetime.now(timezone.utc)
+    payload = await scraper.collect_bandwidth_usage(now.strftime("%Y%m%d%H%M%S"), now.isoformat())
+    if not payload:
+        LOGGER.error("No bandwidth metrics were captured from the monitoring page.")
+        return False
+    await asyncio.to_thread(write_bandwidth_output, payload, output_dir, now)
+    return True
+
+
+async def run_interval(scraper: AsyncBandwidthScraper, output_dir: Path, interval: float) -> None:
+    """Collect every ``interval`` seconds, writing each snapshot while the next one is scraped."""
+
+    loop = asyncio.get_running_loop()
+    await scraper.login()
+    pending_write: Optional[asyncio.Future] = None
+    while True:
+        started = loop.time()
+        now = datetime.now(timezone.utc)
+        try:
+            await scraper.ensure_session()
+            payload = await scraper.collect_bandwidth_usage(now.strftime("%Y%m%d%H%M%S"), now.isoformat())
+        except PlaywrightError as err:
+            LOGGER.warning("Bandwidth collection failed: %s", err)
+            payload = {}
+
+        if pending_write is not None:
+            await pending_write
+            pending_write = None
+        if payload:
+            pending_write = asyncio.ensure_future(asyncio.to_thread(write_bandwidth_output, payload, output_dir, now))
+        else:
+            LOGGER.warning("No bandwidth metrics were captured this interval.")
+        await asyncio.sleep(max(0.0, interval - (loop.time() - started)))
+
+
+async def run(args: argparse.Namespace) -> int:
+    config = load_config(args.config)
+
+    password = args.password or config.get("password", "")
+    if not password:
+        LOGGER.error("Router password must be provided via config or --password.")
+        return 1
+
+    headless_cfg = True
+    config_headless = config.get("headless")
+    if config_headless is not None:
+        headless_cfg = str(config_headless).lower() in {"1", "true", "yes", "on"}
+    if args.headless is not None:
+        headless_cfg = args.headless
+
+    output_dir = args.output_dir or Path(config["output_dir"])
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(
+            headless=headless_cfg,
+            args=["--disable-gpu", "--no-sandbox", "--disable-dev-shm-usage"],
+        )
+        try:
+            context = await browser.new_context(ignore_https_errors=True, viewport={"width": 1920, "height": 1080})
+            scraper = AsyncBandwidthScraper(
+                base_url=config.get("url", "https://192.168.1.1"),
+                password=password,
+                page=await context.new_page(),
+                timeout=args.wait_timeout,
+                delay=args.delay,
+            )
+            if args.interval:
+                await run_interval(scraper, output_dir, args.interval)
+            elif not await collect_once(scraper, output_dir):
+                return 1
+        finally:
+            await browser.close()
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    configure_logging(args.debug)
+    try:
+        return asyncio.run(run(args))
+    except KeyboardInterrupt:
+        LOGGER.warning("Scraper interrupted by user.")
+        return 1
+    except Exception:
+        LOGGER.exception("Async bandwidth scraper failed.")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import re
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
@@ -18,10 +22,145 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from router_scraper import build_driver, clean_text, configure_logging, load_config, normalize_label
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
+
+from router_scraper import (
+    DEFAULT_PROFILE_DIR,
+    build_driver,
+    clean_text,
+    configure_logging,
+    load_config,
+    lock_profile_dir,
+    make_soup,
+    normalize_label,
+)
 
 LOGGER = logging.getLogger("bandwidth_scraper")
 SIZE_PATTERN = re.compile(r"^(?P<value>[0-9]*\.?[0-9]+)\s*(?P<unit>[a-zA-Z]+)?$")
+_TAB_XPATH = "//div[contains(@class,'cat-info') and normalize-space()={!r}]"
+_BAND_ROW_SEL = (By.CSS_SELECTOR, "span.band-row-text")
+_ROW_ANCESTOR_SEL = (By.XPATH, "./ancestor::div[contains(@class,'row')][1]")
+_DETAIL_ROWS_SEL = (By.XPATH, "following-sibling::div[1]/div[contains(@class,'row')]")
+_ROW_TOGGLE_SEL = (By.CSS_SELECTOR, "span.vs__open-indicator")
+_NAV_BAR_PRESENT = EC.presence_of_element_located((By.ID, "navigation_bar"))
+_TABS_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, "div.cat-info"))
+_PASSWORD_PRESENT = EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
+_CONTENT_SELECTOR = "div.main-content div.scroll-content-box"
+LAN_ROWS_SELECTOR = "span.band-row-text"
+# Resolves as soon as an element matching the selector argument renders, or with false after the timeout (ms).
+_CONTENT_READY_JS = """
+const [selector, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const ready = () => document.querySelector(selector) !== null;
+if (ready()) return done(true);
+const observer = new MutationObserver(() => {
+  if (!ready()) return;
+  observer.disconnect();
+  clearTimeout(timer);
+  done(true);
+});
+const timer = setTimeout(() => {
+  observer.disconnect();
+  done(false);
+}, timeout);
+observer.observe(document.body, {childList: true, subtree: true});
+"""
+JSONL_FILENAME = "bandwidth.jsonl"
+JSONL_MAX_BYTES = 64 * 1024 * 1024
+_WANTED_LABELS = frozenset({"upload", "download"})
+UNIT_MULTIPLIERS = {
+    "b": 1,
+    "byte": 1,
+    "bytes": 1,
+    "kb": 1024,
+    "kilobyte": 1024,
+    "kilobytes": 1024,
+    "mb": 1024 ** 2,
+    "megabyte": 1024 ** 2,
+    "megabytes": 1024 ** 2,
+    "gb": 1024 ** 3,
+    "gigabyte": 1024 ** 3,
+    "gigabytes": 1024 ** 3,
+    "tb": 1024 ** 4,
+    "terabyte": 1024 ** 4,
+    "terabytes": 1024 ** 4,
+}
+
+# Clicks every collapsed LAN row toggle in one round trip; returns the number of device rows.
+EXPAND_ROWS_JS = """
+const spans = document.querySelectorAll('span.band-row-text');
+spans.forEach((span) => {
+  const row = span.closest('div.row');
+  if (!row) return;
+  const detail = row.nextElementSibling;
+  if (detail && detail.querySelectorAll(':scope > div.row').length >= 3) return;
+  const toggle = row.querySelector('span.vs__open-indicator');
+  if (toggle) toggle.click();
+});
+return spans.length;
+"""
+# Mirrors extract_one_hour_usage/find_first_usage_block so only the metric strings cross the driver bridge.
+USAGE_JS_HELPERS = """
+const text = (node) => (node ? node.textContent.replace(/\\s+/g, ' ').trim() : '');
+const label = (node) => text(node).toLowerCase();
+const divChildren = (node, rowsOnly) => Array.from(node.children).filter(
+  (child) => child.tagName === 'DIV' && (!rowsOnly || child.classList.contains('row'))
+);
+const oneHourUsage = (block) => {
+  const rows = divChildren(block, true);
+  if (rows.length < 3) return null;
+  const oneHourIdx = divChildren(rows[0]).findIndex((col) => label(col) === '1hr');
+  if (oneHourIdx < 0) return null;
+  const results = {};
+  rows.slice(1).forEach((row) => {
+    const columns = divChildren(row);
+    if (!columns.length || oneHourIdx >= columns.length) return;
+    const name = label(columns[0]);
+    if (name === 'upload' || name === 'download') results[name] = text(columns[oneHourIdx]);
+  });
+  return Object.keys(results).length ? results : null;
+};
+"""
+WAN_EXTRACT_JS = USAGE_JS_HELPERS + """
+for (const container of document.querySelectorAll('div.scroll-content-box div')) {
+  const rows = divChildren(container, true);
+  if (rows.length < 3) continue;
+  const firstCell = divChildren(rows[0])[0];
+  if (!firstCell || label(firstCell) !== 'usage') continue;
+  // Expanded LAN devices carry their own usage table next to the device's summary row.
+  if (container.parentElement && container.parentElement.querySelector('span.band-row-text')) continue;
+  return oneHourUsage(container);
+}
+return null;
+"""
+LAN_EXTRACT_JS = USAGE_JS_HELPERS + """
+return Array.from(document.querySelectorAll('span.band-row-text')).map((span) => {
+  const summary = span.closest('div.row');
+  if (!summary || !summary.parentElement) return null;
+  const blocks = divChildren(summary.parentElement);
+  if (blocks.length < 2) return null;
+  const usage = oneHourUsage(blocks[1]);
+  if (!usage) return null;
+  const cells = summary.querySelectorAll('div[role="cell"]');
+  return {
+    device_name: text(span),
+    ip_address: cells.length >= 3 ? text(cells[2]) : '',
+    total_usage: cells.length >= 4 ? text(cells[3]) : '',
+    upload_1hr: usage.upload || '',
+    download_1hr: usage.download || '',
+  };
+}).filter(Boolean);
+"""
+EXPANDED_COUNT_JS = """
+return Array.from(document.querySelectorAll('span.band-row-text')).filter((span) => {
+  const row = span.closest('div.row');
+  const detail = row && row.nextElementSibling;
+  return detail && detail.querySelectorAll(':scope > div.row').length >= 3;
+}).length;
+"""
 
 
 def parse_args() -> argparse.Namespace:
@@ -61,7 +200,43 @@ def parse_args() -> argparse.Namespace:
         "--delay",
         type=float,
         default=1.0,
-        help="Seconds to wait after navigation before scraping HTML.",
+        help="Maximum seconds to wait for each bandwidth tab's table to render after switching to it.",
+    )
+    parser.add_argument(
+        "--wait-timeout",
+        type=int,
+        default=10,
+        help="Seconds to wait for page elements before giving up.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=DEFAULT_PROFILE_DIR,
+        help="Chrome profile directory reused between runs so the router UI assets stay cached.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        help="Keep the browser open and collect every N seconds instead of running once.",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Scrape the WAN and LAN tabs concurrently from two browser sessions.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("files", "jsonl"),
+        default="files",
+        help="Write one JSON file per run, or append runs to a single bandwidth.jsonl log.",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "With --interval, don't write a snapshot whose metrics match the previous one. "
+            "The viewer then averages the next change over the skipped intervals."
+        ),
     )
     return parser.parse_args()
 
@@ -75,13 +250,27 @@ class BandwidthScraper:
         output_dir: Path,
         driver_path: Optional[Path],
         delay: float,
-        timeout: int = 30,
+        timeout: int = 10,
+        profile_dir: Optional[Path] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.password = password
         self.output_dir = output_dir
         self.delay = delay
-        self.driver = build_driver(headless=headless, driver_path=driver_path)
+        self.session_path = output_dir / ".session.json"
+        # Set while running on cookies from session_path that have not yet produced any metrics.
+        self.session_restored = False
+        # Optional second session that scrapes the LAN tab while this one scrapes WAN.
+        self.peer: Optional[BandwidthScraper] = None
+        self.profile_lock = lock_profile_dir(profile_dir) if profile_dir else None
+        if profile_dir and not self.profile_lock:
+            LOGGER.warning("Browser profile %s is in use; starting with a fresh profile.", profile_dir)
+            profile_dir = None
+        try:
+            self.driver = build_driver(headless=headless, driver_path=driver_path, profile_dir=profile_dir)
+        except WebDriverException:
+            self._release_profile()
+            raise
         self.wait = WebDriverWait(self.driver, timeout)
 
     def close(self) -> None:
@@ -89,15 +278,22 @@ class BandwidthScraper:
             self.driver.quit()
         except WebDriverException:
             LOGGER.debug("Driver already closed.")
+        self._release_profile()
+        if self.peer:
+            self.peer.close()
+
+    def _release_profile(self) -> None:
+        if self.profile_lock:
+            self.profile_lock.close()
+            self.profile_lock = None
 
     def login(self) -> None:
         login_url = f"{self.base_url}/#/login/"
         LOGGER.info("Navigating to login page %s", login_url)
         self.driver.get(login_url)
         try:
-            password_field = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
-            )
+            # The first navigation also pulls the SPA bundles, so allow it more time.
+            password_field = WebDriverWait(self.driver, 20).until(_PASSWORD_PRESENT)
         except TimeoutException as err:
             LOGGER.error("Password field did not load: %s", err)
             raise
@@ -113,34 +309,105 @@ class BandwidthScraper:
         login_button.click()
 
         try:
-            self.wait.until(EC.presence_of_element_located((By.ID, "navigation_bar")))
+            self.wait.until(_NAV_BAR_PRESENT)
             LOGGER.info("Login successful.")
         except TimeoutException:
             LOGGER.warning("Navigation bar did not appear; continuing assuming existing session.")
+            return
+        self.save_session()
+
+    def sign_in(self) -> None:
+        """Reuse the saved session cookies when the router still accepts them, else log in."""
+
+        self.session_restored = self.restore_session()
+        if self.session_restored:
+            LOGGER.info("Reused saved router session; skipping login.")
+        else:
+            self.login()
+        if self.peer:
+            self.peer.sign_in()
+
+    def discard_session(self) -> None:
+        """Delete saved cookies the router no longer honours and sign in with the password instead."""
 
-    def collect(self) -> Dict[str, object]:
+        LOGGER.info("Saved router session yielded no metrics; discarding it and logging in again.")
+        self.session_path.unlink(missing_ok=True)
+        self.session_restored = False
         self.login()
-        run_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        collected_at = datetime.now(timezone.utc).isoformat()
+        if self.peer:
+            self.peer.session_restored = False
+            self.peer.login()
+
+    def save_session(self) -> None:
+        try:
+            data = json.dumps(self.driver.get_cookies()).encode("utf-8")
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            # Create the cookie file owner-only from the start, then swap it in so it is never world-readable.
+            tmp_path = self.session_path.with_suffix(".tmp")
+            tmp_path.unlink(missing_ok=True)
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, self.session_path)
+        except (OSError, WebDriverException) as err:
+            LOGGER.debug("Unable to save session cookies to %s: %s", self.session_path, err)
+
+    def restore_session(self) -> bool:
+        try:
+            cookies = json.loads(self.session_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        LOGGER.debug("Restoring %d saved session cookies from %s", len(cookies), self.session_path)
+        self.driver.get(f"{self.base_url}/")
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException as err:
+                LOGGER.debug("Skipping saved cookie %s: %s", cookie.get("name"), err)
+
+        self.driver.get(f"{self.base_url}/#/adv/monitoring/bandwidth")
+        try:
+            self.wait.until(EC.any_of(_TABS_PRESENT, _PASSWORD_PRESENT))
+        except TimeoutException:
+            return False
+        return bool(self.driver.find_elements(By.CSS_SELECTOR, "div.cat-info"))
+
+    def ensure_session(self) -> None:
+        try:
+            self.wait.until(_NAV_BAR_PRESENT)
+        except TimeoutException:
+            LOGGER.info("Router session appears to have expired; logging in again.")
+            self.login()
+        if self.peer:
+            self.peer.ensure_session()
+
+    def collect(self) -> Tuple[Dict[str, object], datetime]:
+        self.sign_in()
+        now = datetime.now(timezone.utc)
+        run_id = now.strftime("%Y%m%d%H%M%S")
+        collected_at = now.isoformat()
 
         payload = self.collect_bandwidth_usage(run_id, collected_at)
+        if not payload and self.session_restored:
+            # The router may have expired the session server-side while still drawing the page shell.
+            self.discard_session()
+            payload = self.collect_bandwidth_usage(run_id, collected_at)
         if not payload:
             raise RuntimeError("No bandwidth metrics were captured from the monitoring page.")
-        return payload
+        return payload, now
 
     def collect_bandwidth_usage(self, run_id: str, collected_at: str) -> Dict[str, object]:
-        bandwidth_url = f"{self.base_url}/#/adv/monitoring/bandwidth"
-        LOGGER.info("Collecting bandwidth metrics from %s", bandwidth_url)
-        try:
-            self.driver.get(bandwidth_url)
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.cat-info")))
-        except TimeoutException as err:
-            LOGGER.warning("Bandwidth page did not load: %s", err)
-            return {}
-
-        time.sleep(self.delay)
-        wan_metrics = self._scrape_wan_bandwidth()
-        lan_devices = self._scrape_lan_bandwidth()
+        if self.peer is None:
+            if not self._open_bandwidth_page():
+                return {}
+            wan_metrics = self._scrape_wan_bandwidth()
+            lan_devices = self._scrape_lan_bandwidth()
+        else:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                wan_future = pool.submit(self._collect_tab, self._scrape_wan_bandwidth, {})
+                lan_future = pool.submit(self.peer._collect_tab, self.peer._scrape_lan_bandwidth, [])
+                wan_metrics = wan_future.result()
+                lan_devices = lan_future.result()
 
         if not wan_metrics and not lan_devices:
             return {}
@@ -152,82 +419,86 @@ class BandwidthScraper:
             "lan_devices": lan_devices,
         }
 
+    def _open_bandwidth_page(self) -> bool:
+        bandwidth_url = f"{self.base_url}/#/adv/monitoring/bandwidth"
+        LOGGER.info("Collecting bandwidth metrics from %s", bandwidth_url)
+        try:
+            self.driver.get(bandwidth_url)
+            self.wait.until(_TABS_PRESENT)
+        except TimeoutException as err:
+            LOGGER.warning("Bandwidth page did not load: %s", err)
+            return False
+        return True
+
+    def _wait_for_content(self, selector: str) -> None:
+        """Wait up to ``delay`` seconds for ``selector`` to render, returning early once it does."""
+
+        try:
+            ready = self.driver.execute_async_script(_CONTENT_READY_JS, selector, int(self.delay * 1000))
+        except WebDriverException as err:
+            LOGGER.debug("Unable to watch for %s: %s", selector, err)
+            ready = False
+        if not ready:
+            LOGGER.debug("Nothing matched %s after %.1fs; scraping anyway.", selector, self.delay)
+
+    def _collect_tab(self, scrape: Callable[[], Any], empty: Any) -> Any:
+        if not self._open_bandwidth_page():
+            return empty
+        return scrape()
+
     def _scrape_wan_bandwidth(self) -> Dict[str, str]:
         if not self._select_bandwidth_tab("WAN"):
             return {}
 
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        block = find_first_usage_block(soup)
-        if not block:
-            LOGGER.debug("WAN tab did not contain a usage table.")
-            return {}
-
-        metrics = extract_one_hour_usage(block)
+        metrics = self._wait_for_wan_usage()
         if not metrics:
-            LOGGER.debug("WAN usage table did not expose a 1hr column.")
-            return {}
+            metrics = parse_wan_from_html(self._content_html())
+        return build_wan_metrics(metrics)
 
-        upload_bytes = size_to_bytes(metrics.get("upload", ""))
-        download_bytes = size_to_bytes(metrics.get("download", ""))
+    def _wait_for_wan_usage(self) -> Optional[Dict[str, str]]:
+        """Poll for up to ``delay`` seconds until the WAN usage table has rendered, returning its metrics."""
 
-        LOGGER.info(
-            "Captured WAN throughput (1hr): upload=%d bytes, download=%d bytes",
-            upload_bytes,
-            download_bytes,
-        )
-        return {
-            "upload_1hr": upload_bytes,
-            "download_1hr": download_bytes,
-        }
+        try:
+            return WebDriverWait(self.driver, self.delay, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(WAN_EXTRACT_JS)
+            )
+        except WebDriverException as err:
+            LOGGER.debug("WAN usage table did not render after %.1fs: %s", self.delay, err)
+            return None
 
     def _scrape_lan_bandwidth(self) -> List[Dict[str, str]]:
         if not self._select_bandwidth_tab("LAN"):
             return []
 
+        # The device rows render after the tab switch, not with the page.
+        self._wait_for_content(LAN_ROWS_SELECTOR)
         self._expand_all_bandwidth_rows()
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        spans = soup.select("span.band-row-text")
-        devices: List[Dict[str, str]] = []
-        total = len(spans)
-        for index, span in enumerate(spans, start=1):
-            summary_row = span.find_parent("div", class_="row")
-            if not summary_row:
-                continue
-            block_parent = summary_row.parent
-            if not block_parent:
-                continue
-            detail_candidates = [child for child in block_parent.find_all(recursive=False) if child.name == "div"]
-            if len(detail_candidates) < 2:
-                continue
-            usage_block = detail_candidates[1]
-            usage_metrics = extract_one_hour_usage(usage_block)
-            if not usage_metrics:
-                continue
+        rows = self._run_extract_script(LAN_EXTRACT_JS)
+        if not rows:
+            return parse_lan_from_html(self._content_html())
+        return build_lan_devices(rows)
 
-            cells = summary_row.select('div[role="cell"]')
-            ip_address = clean_text(cells[2]) if len(cells) >= 3 else ""
-            total_usage_str = clean_text(cells[3]) if len(cells) >= 4 else ""
-
-            device_name = clean_text(span)
-            LOGGER.info("Collecting bandwidth metrics for %s (%d/%d)", device_name or "Unknown", index, total)
-            total_usage_bytes = size_to_bytes(total_usage_str)
-            upload_bytes = size_to_bytes(usage_metrics.get("upload", ""))
-            download_bytes = size_to_bytes(usage_metrics.get("download", ""))
-            devices.append(
-                {
-                    "device_name": device_name,
-                    "ip_address": ip_address,
-                    "total_usage": total_usage_bytes,
-                    "upload_1hr": upload_bytes,
-                    "download_1hr": download_bytes,
-                }
-            )
+    def _content_html(self) -> str:
+        """Fetch only the monitoring content subtree over CDP, falling back to the full page source."""
 
-        LOGGER.info("Captured bandwidth metrics for %d LAN devices.", len(devices))
-        return devices
+        try:
+            root = self.driver.execute_cdp_cmd("DOM.getDocument", {})["root"]["nodeId"]
+            node = self.driver.execute_cdp_cmd("DOM.querySelector", {"nodeId": root, "selector": _CONTENT_SELECTOR})
+            if node.get("nodeId"):
+                return self.driver.execute_cdp_cmd("DOM.getOuterHTML", {"nodeId": node["nodeId"]})["outerHTML"]
+        except (AttributeError, KeyError, WebDriverException) as err:
+            LOGGER.debug("CDP snapshot unavailable; using full page source: %s", err)
+        return self.driver.page_source
+
+    def _run_extract_script(self, script: str) -> Any:
+        try:
+            return self.driver.execute_script(script)
+        except WebDriverException as err:
+            LOGGER.debug("In-browser extraction failed; falling back to page source: %s", err)
+            return None
 
     def _select_bandwidth_tab(self, label: str) -> bool:
-        xpath = f"//div[contains(@class,'cat-info') and normalize-space()='{label}']"
+        xpath = _TAB_XPATH.format(label)
         try:
             tab = self.driver.find_element(By.XPATH, xpath)
         except NoSuchElementException:
@@ -246,46 +517,67 @@ class BandwidthScraper:
             LOGGER.warning("Timed out waiting for %s tab to activate.")
             return False
 
-        time.sleep(self.delay)
         return True
 
     def _expand_all_bandwidth_rows(self) -> None:
         LOGGER.debug("Expanding LAN bandwidth rows to expose per-device throughput.")
+        device_count = self.driver.execute_script(EXPAND_ROWS_JS)
+        if not device_count:
+            LOGGER.debug("Batch expansion found no rows; falling back to per-row expansion.")
+            self._expand_bandwidth_rows_individually()
+            return
+
+        try:
+            WebDriverWait(self.driver, 5, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(EXPANDED_COUNT_JS) >= device_count
+            )
+        except TimeoutException:
+            LOGGER.debug("Not every LAN row expanded; parsing the rows that did.")
+
+    def _expand_bandwidth_rows_individually(self) -> None:
+        spans = self.driver.find_elements(*_BAND_ROW_SEL)
+        if not spans:
+            LOGGER.warning("No device entries found on the LAN bandwidth tab.")
+            return
+
         index = 0
         stagnation = 0
         max_scrolls = 80
-        scroll_iterations = 0
-        while True:
-            spans = self.driver.find_elements(By.CSS_SELECTOR, "span.band-row-text")
-            if not spans:
-                LOGGER.warning("No device entries found on the LAN bandwidth tab.")
-                return
-            if index >= len(spans):
-                self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-                time.sleep(self.delay)
+        for _ in range(max_scrolls):
+            while index < len(spans):
+                self._expand_bandwidth_row(spans[index])
+                index += 1
+
+            prev_len = len(spans)
+            self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                    lambda driver: driver.execute_script(
+                        "return document.querySelectorAll('span.band-row-text').length"
+                    )
+                    > prev_len
+                )
+            except TimeoutException:
                 stagnation += 1
-                scroll_iterations += 1
-                if stagnation >= 5 or scroll_iterations >= max_scrolls:
+                if stagnation >= 5:
                     break
                 continue
 
             stagnation = 0
-            span = spans[index]
-            index += 1
-            self._expand_bandwidth_row(span)
+            spans = self.driver.find_elements(*_BAND_ROW_SEL)
 
     def _expand_bandwidth_row(self, span: Any) -> None:
         try:
-            row = span.find_element(By.XPATH, "./ancestor::div[contains(@class,'row')][1]")
+            row = span.find_element(*_ROW_ANCESTOR_SEL)
         except WebDriverException:
             return
 
-        detail_rows = row.find_elements(By.XPATH, "following-sibling::div[1]/div[contains(@class,'row')]")
-        if len(detail_rows) >= 3:
+        detail_count = len(row.find_elements(*_DETAIL_ROWS_SEL))
+        if detail_count >= 3:
             return
 
         try:
-            toggle = row.find_element(By.CSS_SELECTOR, "span.vs__open-indicator")
+            toggle = row.find_element(*_ROW_TOGGLE_SEL)
         except NoSuchElementException:
             return
 
@@ -294,7 +586,98 @@ class BandwidthScraper:
             toggle.click()
         except WebDriverException:
             self.driver.execute_script("arguments[0].click();", toggle)
-        time.sleep(self.delay)
+        try:
+            WebDriverWait(self.driver, 2, poll_frequency=0.1).until(
+                lambda _: len(row.find_elements(*_DETAIL_ROWS_SEL)) > detail_count
+            )
+        except TimeoutException:
+            LOGGER.debug("Bandwidth row did not expand after clicking its toggle.")
+
+
+def parse_wan_from_html(html: str) -> Dict[str, str]:
+    """Parse the WAN 1hr upload/download strings from a snapshot of the WAN tab."""
+
+    block = find_first_usage_block(make_soup(html))
+    if not block:
+        LOGGER.debug("WAN tab did not contain a usage table.")
+        return {}
+
+    metrics = extract_one_hour_usage(block)
+    if not metrics:
+        LOGGER.debug("WAN usage table did not expose a 1hr column.")
+    return metrics
+
+
+def build_wan_metrics(metrics: Dict[str, str]) -> Dict[str, int]:
+    """Convert raw WAN usage strings into the byte counts written to the output payload."""
+
+    if not metrics:
+        return {}
+
+    upload_bytes = size_to_bytes(metrics.get("upload", ""))
+    download_bytes = size_to_bytes(metrics.get("download", ""))
+    LOGGER.info(
+        "Captured WAN throughput (1hr): upload=%d bytes, download=%d bytes",
+        upload_bytes,
+        download_bytes,
+    )
+    return {
+        "upload_1hr": upload_bytes,
+        "download_1hr": download_bytes,
+    }
+
+
+def parse_lan_from_html(html: str) -> List[Dict[str, object]]:
+    """Parse per-device LAN usage from a snapshot of the expanded LAN tab."""
+
+    soup = make_soup(html)
+    rows: List[Dict[str, str]] = []
+    # Each device block holds its summary row followed by the expanded usage table.
+    for block in soup.select("div.scroll-content-box > div > div"):
+        children = block.find_all("div", recursive=False)
+        if len(children) < 2:
+            continue
+        summary_row = children[0]
+        span = summary_row.find("span", class_="band-row-text")
+        if not span or "row" not in (summary_row.get("class") or []):
+            continue
+        usage_metrics = extract_one_hour_usage(children[1])
+        if not usage_metrics:
+            continue
+
+        cells = summary_row.select('div[role="cell"]')
+        rows.append(
+            {
+                "device_name": clean_text(span),
+                "ip_address": clean_text(cells[2]) if len(cells) >= 3 else "",
+                "total_usage": clean_text(cells[3]) if len(cells) >= 4 else "",
+                "upload_1hr": usage_metrics.get("upload", ""),
+                "download_1hr": usage_metrics.get("download", ""),
+            }
+        )
+    return build_lan_devices(rows)
+
+
+def build_lan_devices(rows: List[Dict[str, str]]) -> List[Dict[str, object]]:
+    """Convert raw LAN usage strings into the byte counts written to the output payload."""
+
+    devices: List[Dict[str, object]] = []
+    total = len(rows)
+    for index, row in enumerate(rows, start=1):
+        device_name = row.get("device_name", "")
+        LOGGER.info("Collecting bandwidth metrics for %s (%d/%d)", device_name or "Unknown", index, total)
+        devices.append(
+            {
+                "device_name": device_name,
+                "ip_address": row.get("ip_address", ""),
+                "total_usage": size_to_bytes(row.get("total_usage", "")),
+                "upload_1hr": size_to_bytes(row.get("upload_1hr", "")),
+                "download_1hr": size_to_bytes(row.get("download_1hr", "")),
+            }
+        )
+
+    LOGGER.info("Captured bandwidth metrics for %d LAN devices.", len(devices))
+    return devices
 
 
 def find_first_usage_block(soup: BeautifulSoup):
@@ -307,6 +690,9 @@ def find_first_usage_block(soup: BeautifulSoup):
             continue
         if normalize_label(first_cell.get_text()) != "usage":
             continue
+        # Expanded LAN devices carry their own usage table next to the device's summary row.
+        if container.parent is not None and container.parent.select_one(LAN_ROWS_SELECTOR):
+            continue
         return container
     return None
 
@@ -328,7 +714,7 @@ def extract_one_hour_usage(block) -> Dict[str, str]:
         if not columns:
             continue
         label = normalize_label(clean_text(columns[0]))
-        if label not in {"upload", "download"}:
+        if label not in _WANTED_LABELS:
             continue
         if one_hour_idx >= len(columns):
             continue
@@ -344,46 +730,143 @@ def size_to_bytes(raw_value: Optional[str]) -> int:
         return 0
     if text.isdigit():
         return int(text)
+
+    # Fast path for the "<number> <unit>" shape the router always renders; the regex handles the rest.
+    unit = text.lstrip("0123456789.")
+    number = text[: len(text) - len(unit)]
+    unit = unit.lstrip()
+    if (
+        number
+        and number.count(".") <= 1
+        and not number.endswith(".")
+        and (not unit or (unit.isascii() and unit.isalpha()))
+    ):
+        return int(float(number) * UNIT_MULTIPLIERS.get(unit.lower() or "bytes", 1))
+
     match = SIZE_PATTERN.match(text)
     if not match:
         return 0
     value = float(match.group("value"))
     unit = (match.group("unit") or "bytes").lower()
-    multiplier = {
-        "b": 1,
-        "byte": 1,
-        "bytes": 1,
-        "kb": 1024,
-        "kilobyte": 1024,
-        "kilobytes": 1024,
-        "mb": 1024 ** 2,
-        "megabyte": 1024 ** 2,
-        "megabytes": 1024 ** 2,
-        "gb": 1024 ** 3,
-        "gigabyte": 1024 ** 3,
-        "gigabytes": 1024 ** 3,
-        "tb": 1024 ** 4,
-        "terabyte": 1024 ** 4,
-        "terabytes": 1024 ** 4,
-    }.get(unit, 1)
+    multiplier = UNIT_MULTIPLIERS.get(unit, 1)
     return int(value * multiplier)
 
 
-def write_bandwidth_output(payload: Dict[str, object], output_dir: Path) -> Optional[Path]:
+def payload_digest(payload: Dict[str, object]) -> bytes:
+    """Hash the metrics of a payload, ignoring the per-run identifiers."""
+
+    metrics = {"wan": payload.get("wan"), "lan_devices": payload.get("lan_devices")}
+    if orjson is not None:
+        data = orjson.dumps(metrics, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(metrics, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def write_bandwidth_output(
+    payload: Dict[str, object],
+    output_dir: Path,
+    when: Optional[datetime] = None,
+    output_format: str = "files",
+) -> Optional[Path]:
     if not payload:
         return None
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    if output_format == "jsonl":
+        return append_bandwidth_jsonl(payload, output_dir, when)
+
+    timestamp = (when or datetime.now(timezone.utc)).strftime("%Y%m%d-%H%M%S")
     output_path = output_dir / f"device_bandwidth_{timestamp}.json"
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2).encode("utf-8")
+    with output_path.open("wb", buffering=1 << 20) as handle:
+        handle.write(data)
 
     lan_count = len(payload.get("lan_devices", [])) if isinstance(payload.get("lan_devices"), list) else 0
     LOGGER.info("Wrote bandwidth metrics for %d devices to %s", lan_count, output_path)
     return output_path
 
 
+def append_bandwidth_jsonl(
+    payload: Dict[str, object],
+    output_dir: Path,
+    when: Optional[datetime] = None,
+) -> Path:
+    """Append one payload line to the rolling JSONL log, rotating it once it grows too large."""
+
+    output_path = output_dir / JSONL_FILENAME
+    try:
+        if output_path.stat().st_size >= JSONL_MAX_BYTES:
+            timestamp = (when or datetime.now(timezone.utc)).strftime("%Y%m%d-%H%M%S")
+            rotated = output_path.with_name(f"bandwidth-{timestamp}.jsonl")
+            output_path.rename(rotated)
+            LOGGER.info("Rotated %s to %s", output_path, rotated)
+    except FileNotFoundError:
+        pass
+
+    if orjson is not None:
+        line = orjson.dumps(payload) + b"\n"
+    else:
+        line = json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+    # A single O_APPEND write keeps lines intact if two scrapers append at once.
+    fd = os.open(output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    lan_count = len(payload.get("lan_devices", [])) if isinstance(payload.get("lan_devices"), list) else 0
+    LOGGER.info("Appended bandwidth metrics for %d devices to %s", lan_count, output_path)
+    return output_path
+
+
+def run_interval(
+    scraper: BandwidthScraper,
+    output_dir: Path,
+    interval: float,
+    output_format: str = "files",
+    skip_unchanged: bool = False,
+) -> None:
+    """Reuse one logged-in browser and collect bandwidth metrics every ``interval`` seconds."""
+
+    scraper.sign_in()
+    last_digest: Optional[bytes] = None
+    while True:
+        started = time.monotonic()
+        now = datetime.now(timezone.utc)
+        run_id = now.strftime("%Y%m%d%H%M%S")
+        collected_at = now.isoformat()
+        try:
+            scraper.ensure_session()
+            payload = scraper.collect_bandwidth_usage(run_id, collected_at)
+            if not payload and scraper.session_restored:
+                scraper.discard_session()
+                payload = scraper.collect_bandwidth_usage(run_id, collected_at)
+            scraper.session_restored = False
+        except WebDriverException as err:
+            LOGGER.warning("Bandwidth collection failed: %s", err)
+            payload = {}
+
+        digest = payload_digest(payload) if payload and skip_unchanged else None
+        if not payload:
+            LOGGER.warning("No bandwidth metrics were captured this interval.")
+        elif digest is not None and digest == last_digest:
+            LOGGER.info("Bandwidth metrics unchanged since the last write; skipping.")
+        else:
+            write_bandwidth_output(payload, output_dir, when=now, output_format=output_format)
+            last_digest = digest
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+def _exit_on_sigterm(signum: int, _frame: Any) -> None:
+    LOGGER.info("Received signal %d; shutting down.", signum)
+    raise SystemExit(0)
+
+
 def main() -> int:
     args = parse_args()
     configure_logging(args.debug)
@@ -411,11 +894,39 @@ def main() -> int:
         output_dir=output_dir,
         driver_path=driver_path,
         delay=args.delay,
+        timeout=args.wait_timeout,
+        profile_dir=args.profile_dir,
     )
 
+    if args.parallel:
+        # The peer gets a throwaway profile; the persistent one is locked by the primary session.
+        try:
+            scraper.peer = BandwidthScraper(
+                base_url=config.get("url", "https://192.168.1.1"),
+                password=password,
+                headless=headless_cfg,
+                output_dir=output_dir,
+                driver_path=driver_path,
+                delay=args.delay,
+                timeout=args.wait_timeout,
+            )
+        except WebDriverException:
+            scraper.close()
+            return 1
+
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
     try:
-        payload = scraper.collect()
-        write_bandwidth_output(payload, output_dir)
+        if args.interval:
+            run_interval(
+                scraper,
+                output_dir,
+                args.interval,
+                output_format=args.format,
+                skip_unchanged=args.skip_unchanged,
+            )
+        else:
+            payload, collected = scraper.collect()
+            write_bandwidth_output(payload, output_dir, when=collected, output_format=args.format)
     except KeyboardInterrupt:
         LOGGER.warning("Scraper interrupted by user.")
         return 1
@@ -6,17 +6,22 @@ from __future__ import annotations
 
 import argparse
 import configparser
+import fcntl
 import json
 import logging
+import queue
+import re
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional, Sequence
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -29,7 +34,64 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is an optional speedup; BeautifulSoup handles parsing without it.
+    LexborHTMLParser = None
+
 LOGGER = logging.getLogger("router_scraper")
+DEFAULT_PROFILE_DIR = Path.home() / ".cache" / "fios-lens" / "chrome-profile"
+# Only build the parts of the tree the scrapers read: list rows, and the detail page's main content.
+# Strainers see the raw class attribute ("row wifi-row"), so match on whitespace-delimited tokens.
+ROW_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)row(\s|$)"))
+DETAIL_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)main-content(\s|$)"))
+_UNNORMALIZED_WHITESPACE = re.compile(r"\s\s|[^\S ]")
+# Stylesheets are left alone: scrolling the device list and clicking rows depend on the page layout.
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*analytics*",
+]
+# The device list rows all live under the main content pane; the sidebar and header are never parsed.
+_DEVICE_LIST_SELECTOR = "div.main-content"
+# Returns [cell texts, detail href] for every device row. Cell text mirrors clean_text: text nodes joined
+# with spaces and whitespace collapsed (innerText would depend on CSS visibility and text-transform).
+DEVICE_ROWS_JS = """
+const text = (node) => {
+  const parts = [];
+  const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+  while (walker.nextNode()) {
+    const tag = walker.currentNode.parentNode.tagName;
+    if (tag !== 'SCRIPT' && tag !== 'STYLE') parts.push(walker.currentNode.data);
+  }
+  return parts.join(' ').replace(/\\s+/g, ' ').trim();
+};
+return Array.from(document.querySelectorAll('div.row.wifi-row')).map((row) => {
+  const link = row.querySelector('a[href*="settings/"]');
+  return [Array.from(row.querySelectorAll('div[role="cell"]')).map(text), link ? link.getAttribute('href') : ''];
+});
+"""
+# Selectors used on every scroll or detail page, compiled once instead of per call.
+ROW_SELECTOR = soupsieve.compile("div.row.wifi-row")
+NESTED_TYPE_SELECTOR = soupsieve.compile("span.dev-type span.dev-type")
+TYPE_SELECTOR = soupsieve.compile("span.dev-type")
+DEV_CLASS_SELECTOR = soupsieve.compile("div.dev-class")
+DEV_INFO_SELECTOR = soupsieve.compile("div.col-4.dev-info")
+HEADING_SELECTOR = soupsieve.compile('div.inner-row div[role="heading"][aria-level="4"].gray6')
+# Markup length once the document has finished loading; two equal readings in a row mean the SPA has settled.
+_DOM_LENGTH_JS = "return document.readyState === 'complete' ? document.body.innerHTML.length : null;"
 
 LABEL_TO_KEY = {
     "connection": "connection",
@@ -57,6 +119,12 @@ LABEL_TO_KEY = {
     "dmz host": "dmz_host",
     "dns server": "dns_server",
 }
+# Headings usually match one of these spellings exactly, so most lookups skip normalize_label.
+_LABEL_KEY_FAST = {
+    variant: key
+    for label, key in LABEL_TO_KEY.items()
+    for variant in (label, label.title(), label.upper(), label.capitalize())
+}
 
 
 def configure_logging(debug: bool) -> None:
@@ -69,14 +137,28 @@ def configure_logging(debug: bool) -> None:
         LOGGER.debug("Debug logging enabled")
 
 
+@lru_cache(maxsize=128)
 def normalize_label(label: str) -> str:
-    return " ".join(label.strip().lower().split())
+    return " ".join(label.split()).lower()
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with lxml when it is installed, falling back to the stdlib parser."""
+
+    try:
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
 
 
 def clean_text(node) -> str:
     if not node:
         return ""
-    return " ".join(node.get_text(" ", strip=True).split())
+    text = " ".join(node.stripped_strings)
+    # Strings are only stripped at their ends; collapse the rare ones with inner whitespace runs.
+    if _UNNORMALIZED_WHITESPACE.search(text):
+        return " ".join(text.split())
+    return text
 
 
 def parse_args() -> argparse.Namespace:
@@ -116,7 +198,20 @@ def parse_args() -> argparse.Namespace:
         "--delay",
         type=float,
         default=1.0,
-        help="Seconds to wait after navigation before scraping HTML.",
+        help="Maximum seconds to wait for the page to stop changing after navigation or scrolling.",
+    )
+    parser.add_argument(
+        "--attach-cdp",
+        nargs="?",
+        const="127.0.0.1:9222",
+        metavar="HOST:PORT",
+        help="Attach to an already running Chrome started with --remote-debugging-port instead of launching one.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of browser sessions used to fetch device detail pages in parallel.",
     )
     return parser.parse_args()
 
@@ -152,10 +247,42 @@ def load_config(config_path: Path) -> Dict[str, str]:
     }
 
 
-def build_driver(headless: bool, driver_path: Optional[Path]) -> webdriver.Chrome:
+def lock_profile_dir(profile_dir: Path) -> Optional[IO[str]]:
+    """Take an exclusive lock on a Chrome profile; returns None if another scraper holds it."""
+
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    handle = (profile_dir / ".fios-lens.lock").open("w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+def build_driver(
+    headless: bool,
+    driver_path: Optional[Path],
+    profile_dir: Optional[Path] = None,
+    debugger_address: Optional[str] = None,
+    block_images: bool = False,
+) -> webdriver.Chrome:
     options = ChromeOptions()
+    if debugger_address:
+        # An attached browser keeps its own launch flags; ChromeDriver rejects most options here.
+        options.debugger_address = debugger_address
+        service = Service(executable_path=str(driver_path)) if driver_path else None
+        try:
+            return webdriver.Chrome(options=options, service=service)
+        except WebDriverException as err:
+            LOGGER.error("Unable to attach to Chrome at %s: %s", debugger_address, err)
+            raise
+
     if headless:
         options.add_argument("--headless=new")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-dir={profile_dir / 'cache'}")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--no-sandbox")
@@ -164,6 +291,8 @@ def build_driver(headless: bool, driver_path: Optional[Path]) -> webdriver.Chrom
     options.add_argument("--allow-insecure-localhost")
     options.set_capability("acceptInsecureCerts", True)
     options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    if block_images:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
     service = Service(executable_path=str(driver_path)) if driver_path else None
     try:
@@ -185,18 +314,27 @@ class DeviceRecord:
 
     @classmethod
     def from_row(cls, row, base_url: str) -> Optional["DeviceRecord"]:
-        cells = row.select('div[role="cell"]')
+        link = row.find("a", href=lambda value: value and "settings/" in value)
+        href = link["href"] if link else ""
+        cells = row.find_all("div", attrs={"role": "cell"})
+        return cls.from_values([clean_text(cell) for cell in cells], href, base_url)
+
+    @classmethod
+    def from_lexbor_row(cls, row, base_url: str) -> Optional["DeviceRecord"]:
+        link = row.css_first('a[href*="settings/"]')
+        href = (link.attributes.get("href") or "") if link else ""
+        return cls.from_values([lexbor_text(cell) for cell in row.css('div[role="cell"]')], href, base_url)
+
+    @classmethod
+    def from_values(cls, cells: Sequence[str], href: str, base_url: str) -> Optional["DeviceRecord"]:
         if len(cells) < 5:
             return None
 
-        name = clean_text(cells[0])
-        connection = clean_text(cells[1])
-        host = clean_text(cells[2])
-        mac_address = clean_text(cells[3]).lower()
-        parental_controls = clean_text(cells[4]) or "None"
-
-        link = row.select_one('a[href*="settings/"]')
-        href = link["href"] if link and link.has_attr("href") else ""
+        name = cells[0]
+        connection = cells[1]
+        host = cells[2]
+        mac_address = cells[3].lower()
+        parental_controls = cells[4] or "None"
         detail_url = urljoin(base_url + "/", href) if href else f"{base_url}/#/adv/devices/list/settings/{mac_address}"
 
         return cls(
@@ -219,15 +357,48 @@ class RouterScraper:
         driver_path: Optional[Path],
         delay: float,
         timeout: int = 30,
+        debugger_address: Optional[str] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.password = password
         self.output_dir = output_dir
         self.delay = delay
-        self.driver = build_driver(headless=headless, driver_path=driver_path)
+        self.attached = bool(debugger_address)
+        # Extra logged-in sessions that share the detail page workload (see --concurrency).
+        self.workers: List[RouterScraper] = []
+        self.driver = build_driver(
+            headless=headless,
+            driver_path=driver_path,
+            debugger_address=debugger_address,
+            block_images=True,
+        )
+        if self.attached:
+            # Work in our own tab so the long-lived browser's existing windows are left alone.
+            self.driver.switch_to.new_window("tab")
+        self._block_heavy_resources()
         self.wait = WebDriverWait(self.driver, timeout)
 
+    def _block_heavy_resources(self) -> None:
+        """Stop the current tab from fetching images, fonts and analytics; only the DOM text is scraped."""
+
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as err:
+            LOGGER.debug("Unable to block page resources: %s", err)
+
     def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+        if self.attached:
+            try:
+                self.driver.close()
+            except WebDriverException:
+                LOGGER.debug("Scraper tab already closed.")
+            # Stop only our ChromeDriver; the attached browser keeps running for the next invocation.
+            self.driver.service.stop()
+            return
+
         try:
             self.driver.quit()
         except WebDriverException:
@@ -284,7 +455,7 @@ class RouterScraper:
                 stagnation = 0
 
             self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-            time.sleep(self.delay)
+            self._wait_dom_stable()
 
             if stagnation >= 5:
                 break
@@ -294,18 +465,37 @@ class RouterScraper:
         return list(seen.values())
 
     def _capture_visible_rows(self, seen: Dict[str, DeviceRecord]) -> int:
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
         added = 0
-        for row in soup.select("div.row.wifi-row"):
-            record = DeviceRecord.from_row(row, self.base_url)
-            if not record:
-                continue
+        for record in self._visible_device_rows():
             if record.mac_address in seen:
                 continue
             seen[record.mac_address] = record
             added += 1
         return added
 
+    def _visible_device_rows(self) -> List[DeviceRecord]:
+        """Extract the rendered rows in one script call, parsing the list HTML only if that fails."""
+
+        try:
+            rows = self.driver.execute_script(DEVICE_ROWS_JS)
+        except WebDriverException as err:
+            LOGGER.debug("In-browser row extraction failed; parsing the list HTML: %s", err)
+            rows = None
+        if not rows:
+            return parse_device_rows(self._device_list_html(), self.base_url)
+
+        records = [DeviceRecord.from_values(cells, href or "", self.base_url) for cells, href in rows]
+        return [record for record in records if record]
+
+    def _device_list_html(self) -> str:
+        """Return just the device list container, falling back to the full page source."""
+
+        try:
+            return self.driver.find_element(By.CSS_SELECTOR, _DEVICE_LIST_SELECTOR).get_attribute("outerHTML")
+        except WebDriverException as err:
+            LOGGER.debug("Device list container unavailable; using full page source: %s", err)
+            return self.driver.page_source
+
     def collect_device_details(self, url: str, attempts: int = 2) -> Dict[str, str]:
         """Fetch the device detail page, retrying if the DOM never materializes."""
 
@@ -323,7 +513,7 @@ class RouterScraper:
                 LOGGER.debug(
                     "Retrying device detail page %s (%d/%d)", url, attempt + 1, attempts
                 )
-                time.sleep(self.delay)
+                self._wait_dom_stable()
 
         if not last_details:
             LOGGER.warning("Detail page %s yielded no data after %d attempts.", url, attempts)
@@ -338,21 +528,24 @@ class RouterScraper:
             LOGGER.warning("Timed out waiting for detail page %s: %s", url, err)
             return {}
 
-        time.sleep(self.delay)
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        details: Dict[str, str] = {}
+        self._wait_dom_stable()
+        return parse_device_details(self.driver.page_source)
 
-        status_span = soup.select_one(".icon-dev-bg-on span, .icon-dev-bg-off span")
-        if status_span:
-            details["status"] = clean_text(status_span)
+    def _wait_dom_stable(self, quiet_ms: int = 250) -> None:
+        """Wait until the document has loaded and its markup stops changing, for at most ``delay`` seconds."""
 
-        type_span = soup.select_one("span.dev-type span.dev-type") or soup.select_one("span.dev-type")
-        if type_span:
-            details["device_type"] = clean_text(type_span)
+        last_length: List[Optional[int]] = [None]
 
-        details.update(extract_make_model_os(soup))
-        details.update(extract_label_value_pairs(soup))
-        return details
+        def settled(driver) -> bool:
+            length = driver.execute_script(_DOM_LENGTH_JS)
+            stable = length is not None and length == last_length[0]
+            last_length[0] = length
+            return stable
+
+        try:
+            WebDriverWait(self.driver, self.delay, poll_frequency=quiet_ms / 1000).until(settled)
+        except TimeoutException:
+            LOGGER.debug("Page was still changing after %.1fs; scraping it as is.", self.delay)
 
     def _on_login_page(self) -> bool:
         try:
@@ -379,14 +572,7 @@ class RouterScraper:
         collected_at = datetime.now(timezone.utc).isoformat()
 
         devices_output = []
-        for index, record in enumerate(device_rows, start=1):
-            LOGGER.info("Collecting detail page for %s (%d/%d)", record.mac_address, index, len(device_rows))
-            try:
-                detail_data = self.collect_device_details(record.detail_url)
-            except WebDriverException as err:
-                LOGGER.warning("Failed to load detail page for %s: %s", record.mac_address, err)
-                detail_data = {}
-
+        for record, detail_data in zip(device_rows, self._collect_all_details(device_rows)):
             connection = derive_connection(record.connection, detail_data.get("connection"))
             status = derive_status(detail_data.get("status"), connection)
 
@@ -401,12 +587,9 @@ class RouterScraper:
                 "collected_at": collected_at,
             }
 
-            for key, value in detail_data.items():
-                if key == "connection":
-                    continue
-                if value is None:
-                    continue
-                merged[key] = value
+            merged.update(
+                (key, value) for key, value in detail_data.items() if key != "connection" and value is not None
+            )
 
             devices_output.append(merged)
 
@@ -418,7 +601,70 @@ class RouterScraper:
         }
         return payload
 
+    def _collect_all_details(self, device_rows: List[DeviceRecord]) -> List[Dict[str, str]]:
+        """Fetch every detail page, spreading them across the worker sessions when there are any."""
+
+        total = len(device_rows)
+        if not self.workers:
+            return [self._fetch_details(record, index, total) for index, record in enumerate(device_rows, start=1)]
+
+        for worker in self.workers:
+            worker.login()
+        idle: "queue.Queue[RouterScraper]" = queue.Queue()
+        for session in [self, *self.workers]:
+            idle.put(session)
+
+        def fetch(index: int, record: DeviceRecord) -> Dict[str, str]:
+            session = idle.get()
+            try:
+                return session._fetch_details(record, index, total)
+            finally:
+                idle.put(session)
+
+        with ThreadPoolExecutor(max_workers=idle.qsize()) as pool:
+            return list(pool.map(fetch, range(1, total + 1), device_rows))
+
+    def _fetch_details(self, record: DeviceRecord, index: int, total: int) -> Dict[str, str]:
+        LOGGER.info("Collecting detail page for %s (%d/%d)", record.mac_address, index, total)
+        try:
+            return self.collect_device_details(record.detail_url)
+        except WebDriverException as err:
+            LOGGER.warning("Failed to load detail page for %s: %s", record.mac_address, err)
+            return {}
+
 
+def parse_device_rows(html: str, base_url: str) -> List[DeviceRecord]:
+    if LexborHTMLParser is not None:
+        rows = LexborHTMLParser(html).css("div.row.wifi-row")
+        records = [DeviceRecord.from_lexbor_row(row, base_url) for row in rows]
+    else:
+        soup = make_soup(html, parse_only=ROW_STRAINER)
+        records = [DeviceRecord.from_row(row, base_url) for row in ROW_SELECTOR.select(soup)]
+    return [record for record in records if record]
+
+
+def parse_device_details(html: str) -> Dict[str, str]:
+    if LexborHTMLParser is not None:
+        return parse_device_details_lexbor(LexborHTMLParser(html))
+
+    soup = make_soup(html, parse_only=DETAIL_STRAINER)
+    details: Dict[str, str] = {}
+
+    status_icon = soup.find(class_="icon-dev-bg-on") or soup.find(class_="icon-dev-bg-off")
+    status_span = status_icon.find("span") if status_icon else None
+    if status_span:
+        details["status"] = clean_text(status_span)
+
+    type_span = NESTED_TYPE_SELECTOR.select_one(soup) or TYPE_SELECTOR.select_one(soup)
+    if type_span:
+        details["device_type"] = clean_text(type_span)
+
+    details.update(extract_make_model_os(soup))
+    details.update(extract_label_value_pairs(soup))
+    return details
+
+
+@lru_cache(maxsize=128)
 def derive_connection(primary: str, detail: Optional[str]) -> str:
     candidate = detail or primary or ""
     candidate = candidate.strip()
@@ -449,10 +695,10 @@ def extract_make_model_os(soup: BeautifulSoup) -> Dict[str, str]:
     next_row = current_row.find_next_sibling("div", class_="row")
     collected = []
     while next_row:
-        heading = next_row.select_one("div.dev-class")
+        heading = DEV_CLASS_SELECTOR.select_one(next_row)
         if heading and heading.get_text(strip=True).lower().startswith("host"):
             break
-        value_cell = next_row.select_one("div.col-4.dev-info")
+        value_cell = DEV_INFO_SELECTOR.select_one(next_row)
         if value_cell:
             collected.append(clean_text(value_cell))
         if len(collected) >= 3:
@@ -467,9 +713,9 @@ def extract_make_model_os(soup: BeautifulSoup) -> Dict[str, str]:
 
 def extract_label_value_pairs(soup: BeautifulSoup) -> Dict[str, str]:
     values: Dict[str, str] = {}
-    for heading in soup.select('div.inner-row div[role="heading"][aria-level="4"].gray6'):
-        label = normalize_label(heading.get_text())
-        key = LABEL_TO_KEY.get(label)
+    for heading in HEADING_SELECTOR.select(soup):
+        raw = heading.get_text()
+        key = _LABEL_KEY_FAST.get(raw) or LABEL_TO_KEY.get(normalize_label(raw))
         if not key:
             continue
         value_node = heading.find_next_sibling("div")
@@ -477,12 +723,94 @@ def extract_label_value_pairs(soup: BeautifulSoup) -> Dict[str, str]:
     return values
 
 
+def lexbor_text(node) -> str:
+    """selectolax counterpart of clean_text."""
+
+    if node is None:
+        return ""
+    return " ".join(node.text(separator=" ", strip=True).split())
+
+
+def _lexbor_next_row(node):
+    sibling = node.next
+    while sibling is not None:
+        if sibling.tag == "div" and "row" in (sibling.attributes.get("class") or "").split():
+            return sibling
+        sibling = sibling.next
+    return None
+
+
+def parse_device_details_lexbor(tree) -> Dict[str, str]:
+    details: Dict[str, str] = {}
+
+    status_span = tree.css_first(".icon-dev-bg-on span, .icon-dev-bg-off span")
+    if status_span:
+        details["status"] = lexbor_text(status_span)
+
+    type_span = tree.css_first("span.dev-type span.dev-type") or tree.css_first("span.dev-type")
+    if type_span:
+        details["device_type"] = lexbor_text(type_span)
+
+    details.update(extract_make_model_os_lexbor(tree))
+    details.update(extract_label_value_pairs_lexbor(tree))
+    return details
+
+
+def extract_make_model_os_lexbor(tree) -> Dict[str, str]:
+    results: Dict[str, str] = {}
+    label = next((div for div in tree.css("div") if "Make, Model" in div.text(deep=False)), None)
+    if not label:
+        return results
+    current_row = label.parent
+    while current_row is not None and not (
+        current_row.tag == "div" and "row" in (current_row.attributes.get("class") or "").split()
+    ):
+        current_row = current_row.parent
+    if current_row is None:
+        return results
+
+    next_row = _lexbor_next_row(current_row)
+    collected = []
+    while next_row:
+        heading = next_row.css_first("div.dev-class")
+        if heading and heading.text(strip=True).lower().startswith("host"):
+            break
+        value_cell = next_row.css_first("div.col-4.dev-info")
+        if value_cell:
+            collected.append(lexbor_text(value_cell))
+        if len(collected) >= 3:
+            break
+        next_row = _lexbor_next_row(next_row)
+
+    mapping = ["device_make", "device_model", "device_operating_system"]
+    for key, value in zip(mapping, collected):
+        results[key] = value
+    return results
+
+
+def extract_label_value_pairs_lexbor(tree) -> Dict[str, str]:
+    values: Dict[str, str] = {}
+    for heading in tree.css('div.inner-row div[role="heading"][aria-level="4"].gray6'):
+        raw = heading.text()
+        key = _LABEL_KEY_FAST.get(raw) or LABEL_TO_KEY.get(normalize_label(raw))
+        if not key:
+            continue
+        value_node = heading.next
+        while value_node is not None and value_node.tag != "div":
+            value_node = value_node.next
+        values[key] = lexbor_text(value_node)
+    return values
+
+
 def write_output(payload: Dict[str, object], output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
     output_path = output_dir / f"devices_{timestamp}.json"
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with output_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
     LOGGER.info("Wrote %d devices to %s", payload["device_count"], output_path)
     return output_path
 
@@ -514,7 +842,23 @@ def main() -> int:
         output_dir=output_dir,
         driver_path=driver_path,
         delay=args.delay,
+        debugger_address=args.attach_cdp,
     )
+    try:
+        for _ in range(max(args.concurrency, 1) - 1):
+            scraper.workers.append(
+                RouterScraper(
+                    base_url=config.get("url", "https://192.168.1.1"),
+                    password=password,
+                    headless=headless_cfg,
+                    output_dir=output_dir,
+                    driver_path=driver_path,
+                    delay=args.delay,
+                )
+            )
+    except WebDriverException:
+        scraper.close()
+        return 1
 
     try:
         payload = scraper.scrape()
@@ -4,25 +4,66 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 from flask import Flask, jsonify, render_template
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib codec.
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # ciso8601 is an optional speedup over datetime.fromisoformat.
+    ciso8601 = None
+
+try:
+    import ijson
+except ImportError:  # Without ijson, snapshot files are parsed whole.
+    ijson = None
+
 APP = Flask(__name__, static_folder="static", template_folder="templates")
 LOGGER = logging.getLogger("bandwidth_viewer")
 BASE_DIR = Path(__file__).resolve().parents[1]
 OUTPUT_DIR = BASE_DIR / "output"
+_ONE_MICROSECOND = timedelta(microseconds=1)
 SIZE_PATTERN = re.compile(r"^(?P<value>[0-9]*\.?[0-9]+)\s*(?P<unit>[a-zA-Z]+)?$")
+SIZE_MULTIPLIERS = {
+    "b": 1,
+    "byte": 1,
+    "bytes": 1,
+    "kb": 1024,
+    "kilobytes": 1024,
+    "mb": 1024 ** 2,
+    "megabytes": 1024 ** 2,
+    "gb": 1024 ** 3,
+    "gigabytes": 1024 ** 3,
+}
+_NUMBER_CHARS = frozenset("0123456789.")
+# ijson is several times slower than orjson, so it is only worth it for unusually large snapshot files.
+_STREAM_MIN_BYTES = 8 * 1024 * 1024
+_JSONL_HEAD_BYTES = 256
+_DEVICE_FIELDS = ("device_name", "ip_address", "upload_1hr", "download_1hr")
+
+# Snapshot files are written once (or only appended to), so parsed contents are keyed on mtime.
+# Entries are (mtime_ns, leading bytes, bytes parsed, records); JSONL logs resume parsing from the byte offset.
+_CacheEntry = Tuple[int, bytes, int, List[Dict[str, object]]]
+_SNAPSHOT_CACHE: Dict[Path, _CacheEntry] = {}
+_SERIES_CACHE: Dict[str, object] = {}
 
 
 @dataclass
 class Sample:
     timestamp: datetime
+    timestamp_iso: str
     upload_bytes: float
     download_bytes: float
     ip_address: str
@@ -37,46 +78,63 @@ def index() -> str:
 def api_bandwidth():
     devices = build_throughput_series()
     response = {"last_updated": datetime.utcnow().isoformat() + "Z", "devices": devices}
+    if orjson is not None:
+        return APP.response_class(orjson.dumps(response), mimetype="application/json")
     return jsonify(response)
 
 
 def build_throughput_series() -> List[Dict[str, object]]:
+    try:
+        cache_key = tuple((path, path.stat().st_mtime_ns) for path in snapshot_paths())
+    except OSError:
+        cache_key = None
+    if cache_key is not None and _SERIES_CACHE.get("key") == cache_key:
+        return _SERIES_CACHE["devices"]
+
     entries = load_bandwidth_logs()
     grouped: Dict[Tuple[str, str], List[Sample]] = defaultdict(list)
-    for name, ip, timestamp, upload, download in entries:
+    for name, ip, timestamp, timestamp_iso, upload, download in entries:
         key = (name or ip or "Unknown", ip)
-        grouped[key].append(Sample(timestamp=timestamp, upload_bytes=upload, download_bytes=download, ip_address=ip))
+        grouped[key].append(
+            Sample(
+                timestamp=timestamp,
+                timestamp_iso=timestamp_iso,
+                upload_bytes=upload,
+                download_bytes=download,
+                ip_address=ip,
+            )
+        )
 
     devices_output: List[Dict[str, object]] = []
+    sort_keys: List[str] = []
     for (name, ip), samples in grouped.items():
-        samples.sort(key=lambda sample: sample.timestamp)
         series = []
-        prev = None
-        for sample in samples:
-            if prev is None:
-                prev = sample
-                continue
-            delta_seconds = (sample.timestamp - prev.timestamp).total_seconds()
-            if delta_seconds <= 0:
-                prev = sample
-                continue
-            delta_upload = sample.upload_bytes - prev.upload_bytes
-            delta_download = sample.download_bytes - prev.download_bytes
-            if delta_upload < 0 or delta_download < 0:
-                prev = sample
-                continue
-            upload_mbps = bytes_per_second_to_mbps(delta_upload / delta_seconds)
-            download_mbps = bytes_per_second_to_mbps(delta_download / delta_seconds)
-            series.append(
-                {
-                    "timestamp": sample.timestamp.isoformat(),
-                    "upload_mbps": upload_mbps,
-                    "download_mbps": download_mbps,
-                }
-            )
-            prev = sample
+        if len(samples) > 1:
+            # Whole microseconds keep dt identical to timedelta.total_seconds().
+            first = samples[0].timestamp
+            micros = np.array([(sample.timestamp - first) // _ONE_MICROSECOND for sample in samples], dtype=np.int64)
+            # Snapshots are read in filename order, so samples are normally already chronological.
+            if (np.diff(micros) < 0).any():
+                order = np.argsort(micros, kind="stable")
+                samples = [samples[index] for index in order.tolist()]
+                micros = micros[order]
+            dt = np.diff(micros) / 1_000_000
+            du = np.diff(np.array([sample.upload_bytes for sample in samples], dtype=np.float64))
+            dd = np.diff(np.array([sample.download_bytes for sample in samples], dtype=np.float64))
+            mask = (dt > 0) & (du >= 0) & (dd >= 0)
+            upload_rates = (du / np.where(mask, dt, 1)).tolist()
+            download_rates = (dd / np.where(mask, dt, 1)).tolist()
+            for index in mask.nonzero()[0].tolist():
+                series.append(
+                    {
+                        "timestamp": samples[index + 1].timestamp_iso,
+                        "upload_mbps": bytes_per_second_to_mbps(upload_rates[index]),
+                        "download_mbps": bytes_per_second_to_mbps(download_rates[index]),
+                    }
+                )
 
         if series:
+            sort_keys.append(name.lower())
             devices_output.append(
                 {
                     "device_name": name,
@@ -85,40 +143,135 @@ def build_throughput_series() -> List[Dict[str, object]]:
                 }
             )
 
-    devices_output.sort(key=lambda entry: entry["device_name"].lower())
+    order = sorted(range(len(devices_output)), key=sort_keys.__getitem__)
+    devices_output = [devices_output[index] for index in order]
+    _SERIES_CACHE.update(key=cache_key, devices=devices_output)
     return devices_output
 
 
-def load_bandwidth_logs() -> List[Tuple[str, str, datetime, float, float]]:
-    entries: List[Tuple[str, str, datetime, float, float]] = []
+def load_bandwidth_logs() -> List[Tuple[str, str, datetime, str, float, float]]:
+    entries: List[Tuple[str, str, datetime, str, float, float]] = []
     if not OUTPUT_DIR.exists():
         LOGGER.warning("Output directory %s does not exist", OUTPUT_DIR)
         return entries
 
-    for path in sorted(OUTPUT_DIR.glob("device_bandwidth_*.json")):
-        try:
-            data = json.loads(path.read_text())
-        except Exception as err:  # pylint: disable=broad-except
-            LOGGER.warning("Failed to read %s: %s", path, err)
-            continue
-
+    for path, data in iter_snapshots():
         collected_at = data.get("collected_at")
         try:
-            timestamp = datetime.fromisoformat(collected_at)
+            timestamp = parse_timestamp(collected_at)
         except Exception:  # pylint: disable=broad-except
             LOGGER.warning("Invalid timestamp in %s", path)
             continue
+        # Every device in a snapshot shares this timestamp, so render it once here.
+        timestamp_iso = timestamp.isoformat()
 
         for device in data.get("lan_devices", []):
             name = (device.get("device_name") or "").strip()
             ip_address = (device.get("ip_address") or "").strip()
             upload = parse_size(device.get("upload_1hr", 0))
             download = parse_size(device.get("download_1hr", 0))
-            entries.append((name, ip_address, timestamp, upload, download))
+            entries.append((name, ip_address, timestamp, timestamp_iso, upload, download))
 
     return entries
 
 
+def parse_timestamp(value: str) -> datetime:
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    return datetime.fromisoformat(value)
+
+
+def snapshot_paths() -> List[Path]:
+    return sorted(OUTPUT_DIR.glob("device_bandwidth_*.json")) + sorted(OUTPUT_DIR.glob("bandwidth*.jsonl"))
+
+
+def iter_snapshots() -> Iterator[Tuple[Path, Dict[str, object]]]:
+    """Yield bandwidth snapshots from per-run JSON files and from JSONL logs."""
+
+    paths = snapshot_paths()
+    for stale in set(_SNAPSHOT_CACHE) - set(paths):
+        _SNAPSHOT_CACHE.pop(stale, None)
+
+    for path in paths:
+        try:
+            records = _load_snapshot(path)
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.warning("Failed to read %s: %s", path, err)
+            continue
+        for data in records:
+            yield path, data
+
+
+def _load_snapshot(path: Path) -> List[Dict[str, object]]:
+    """Parse a snapshot file, reusing the previous parse while its mtime is unchanged."""
+
+    stat = path.stat()
+    mtime = stat.st_mtime_ns
+    cached = _SNAPSHOT_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[3]
+
+    if path.suffix == ".jsonl":
+        return _load_jsonl(path, stat, cached)
+
+    if ijson is not None and stat.st_size >= _STREAM_MIN_BYTES:
+        records = [_stream_snapshot(path)]
+    else:
+        records = [_loads(path.read_bytes())]
+    _SNAPSHOT_CACHE[path] = (mtime, b"", stat.st_size, records)
+    return records
+
+
+def _load_jsonl(path: Path, stat: os.stat_result, cached: Optional[_CacheEntry]) -> List[Dict[str, object]]:
+    """Parse a JSONL log, reading only the lines appended since the cached parse."""
+
+    offset = 0
+    records: List[Dict[str, object]] = []
+    with path.open("rb") as handle:
+        head = handle.read(_JSONL_HEAD_BYTES)
+        # The scraper only appends to the log; different leading bytes or a shorter file mean it was rotated.
+        if cached and cached[1] == head and cached[2] <= stat.st_size:
+            # Copy rather than extend in place: a concurrent request may be iterating the cached list.
+            offset, records = cached[2], list(cached[3])
+        handle.seek(offset)
+        data = handle.read()
+    # Only newline-terminated lines are cached; a trailing partial line is re-read next time.
+    complete = data.rfind(b"\n") + 1
+    for line in data[:complete].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(_loads(line))
+        except ValueError as err:
+            LOGGER.warning("Skipping malformed line in %s: %s", path, err)
+    _SNAPSHOT_CACHE[path] = (stat.st_mtime_ns, head, offset + complete, records)
+
+    tail = data[complete:]
+    if tail.strip():
+        try:
+            return records + [_loads(tail)]
+        except ValueError:
+            LOGGER.debug("Ignoring unterminated last line of %s; it may still be being written.", path)
+    return records
+
+
+def _stream_snapshot(path: Path) -> Dict[str, object]:
+    """Read only the fields the viewer uses from a snapshot file, without loading the whole document."""
+
+    with path.open("rb") as handle:
+        collected_at = next(ijson.items(handle, "collected_at"), None)
+        handle.seek(0)
+        devices = [
+            {field: device[field] for field in _DEVICE_FIELDS if field in device}
+            for device in ijson.items(handle, "lan_devices.item", use_float=True)
+        ]
+    return {"collected_at": collected_at, "lan_devices": devices}
+
+
+def _loads(data: bytes) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def parse_size(raw) -> float:
     if raw is None:
         return 0.0
@@ -129,23 +282,24 @@ def parse_size(raw) -> float:
         return 0.0
     if text.isdigit():
         return float(text)
+
+    # Snapshot sizes are almost always "<number> <unit>"; scan that directly and
+    # leave anything unusual to SIZE_PATTERN.
+    index = 0
+    length = len(text)
+    while index < length and text[index] in _NUMBER_CHARS:
+        index += 1
+    number = text[:index]
+    unit = text[index:].lstrip()
+    if number and number[-1] != "." and number.count(".") <= 1 and (not unit or (unit.isascii() and unit.isalpha())):
+        return float(number) * SIZE_MULTIPLIERS.get(unit.lower(), 1)
+
     match = SIZE_PATTERN.match(text)
     if not match:
         return 0.0
     value = float(match.group("value"))
     unit = (match.group("unit") or "bytes").lower()
-    multiplier = {
-        "b": 1,
-        "byte": 1,
-        "bytes": 1,
-        "kb": 1024,
-        "kilobytes": 1024,
-        "mb": 1024 ** 2,
-        "megabytes": 1024 ** 2,
-        "gb": 1024 ** 3,
-        "gigabytes": 1024 ** 3,
-    }.get(unit, 1)
-    return value * multiplier
+    return value * SIZE_MULTIPLIERS.get(unit, 1)
 
 
 def bytes_per_second_to_mbps(value: float) -> float: